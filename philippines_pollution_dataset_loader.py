@@ -15,27 +15,40 @@ This script:
 # Environment Setup
 # ============================================================
 
-!pip install -q earthaccess xarray netCDF4 h5netcdf dask rioxarray \
-               scikit-learn cartopy matplotlib seaborn pyhdf \
-               cdsapi earthengine-api geemap
+!pip install -q earthaccess xarray netCDF4 h5netcdf "dask[distributed]" \
+               rioxarray scikit-learn cartopy matplotlib seaborn pyhdf \
+               cdsapi earthengine-api geemap numba zarr
 
 import os
 import shutil
 import zipfile
 import re
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache
+from pathlib import Path
 
 import earthaccess
 import xarray as xr
 import numpy as np
 import pandas as pd
 import dask
+from dask.distributed import Client
 import rioxarray as rxr
 import cdsapi
 import ee
+from numba import njit
 
 # Optimize Dask slicing
 dask.config.set({"array.slicing.split_large_chunks": True})
 
+# Local cluster shared by every dask step (open, mask, regrid, write)
+client = Client(
+    n_workers=max(1, os.cpu_count() // 2),
+    threads_per_worker=2
+)
+
 # ============================================================
 # Authentication
 # ============================================================
@@ -43,7 +56,10 @@ dask.config.set({"array.slicing.split_large_chunks": True})
 earthaccess.login()
 
 ee.Authenticate()
-ee.Initialize(project="learned-fusion-487816-n2")
+ee.Initialize(
+    project="learned-fusion-487816-n2",
+    opt_url="https://earthengine-highvolume.googleapis.com"
+)
 
 # ============================================================
 # Study Region Definition (Philippines)
@@ -55,6 +71,25 @@ LON_MIN, LON_MAX = 116, 127
 TIME_START = "2019-01-01"
 TIME_END   = "2024-12-31"
 
+# Concurrent granule downloads (Earthdata DAACs throttle above ~16)
+MAX_DOWNLOAD_WORKERS = 16
+
+# Granules are cached here per short name and reused across runs
+CACHE_DIR = Path("~/.earthaccess_cache").expanduser()
+
+# Bump whenever loader processing changes, so stale zarr stores are rebuilt
+STORE_VERSION = 1
+
+# Common 0.1° grid (matches the ERA5-Land request below)
+GRID_RES = 0.1
+
+# Earth Engine tile fetches (1° tiles on the high-volume endpoint)
+NTL_TILE_SIZE = 10
+MAX_EE_WORKERS = 25
+
+# Seconds to wait for CDS to accept or reject the ERA5 request up front
+CDS_REJECT_TIMEOUT = 30
+
 # ============================================================
 # Utility Functions
 # ============================================================
@@ -85,16 +120,26 @@ def detect_spatial_coords(ds):
 def spatial_subset(ds, lat_min, lat_max, lon_min, lon_max):
     """Spatially subset dataset safely."""
     lat_name, lon_name = detect_spatial_coords(ds)
+
+    # Cut 0–360 grids in their native convention first, so only the
+    # window is relabelled rather than re-sorting the full globe
+    if ds[lon_name].max() > 180 and lon_min % 360 <= lon_max % 360:
+        ds = ds.sel({lon_name: slice(lon_min % 360, lon_max % 360)})
     ds = normalize_longitude(ds, lon_name)
 
-    if ds[lat_name][0] > ds[lat_name][-1]:
-        ds = ds.sortby(lat_name)
+    descending = bool(ds[lat_name][0] > ds[lat_name][-1])
+    lat_bounds = (lat_max, lat_min) if descending else (lat_min, lat_max)
 
-    return ds.sel({
-        lat_name: slice(lat_min, lat_max),
+    ds = ds.sel({
+        lat_name: slice(*lat_bounds),
         lon_name: slice(lon_min, lon_max)
     })
 
+    if descending:
+        ds = ds.sortby(lat_name)
+
+    return ds
+
 
 def temporal_subset(ds, start, end):
     """Temporal subset."""
@@ -103,6 +148,85 @@ def temporal_subset(ds, start, end):
     return ds.sel(time=slice(start, end))
 
 
+def run_in_background(fn, *args):
+    """Run fn on a daemon thread and return a Future for its result."""
+    future = Future()
+
+    def _run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    # Daemon, so a failure elsewhere never waits on the task at exit
+    threading.Thread(target=_run, daemon=True).start()
+    return future
+
+
+def raise_if_failed(future):
+    """Re-raise a finished background task's error without blocking."""
+    if future.done():
+        future.result()
+
+
+def align_to_months(da, months, name, min_fraction=0.5):
+    """Snap time to naive month starts and reindex onto the given months."""
+    # Granule times may be tz-aware or mid-month; label by month instead
+    snapped = (
+        pd.DatetimeIndex(da["time"].to_index())
+        .tz_localize(None)
+        .to_period("M")
+        .to_timestamp()
+    )
+    months = pd.DatetimeIndex(months)
+
+    overlap = int(snapped.isin(months).sum())
+    if overlap < min_fraction * len(months):
+        raise ValueError(
+            f"{name} covers only {overlap} of {len(months)} months."
+        )
+
+    return da.assign_coords(time=snapped).reindex(time=months)
+
+
+_GRANULE_RE = re.compile(r'_(\d{6})_')
+
+
+@lru_cache(maxsize=None)
+def parse_granule_month(stamp):
+    """Parse an MMYYYY granule stamp (cached, granules share months)."""
+    return pd.to_datetime(stamp, format="%m%Y")
+
+
+# File name date stamps: MODIS ".AYYYYDDD." and granule "_MMYYYY_"
+_FILENAME_TIME_PATTERNS = [
+    (re.compile(r'\.A(\d{7})\.'), "%Y%j"),
+    (_GRANULE_RE, "%m%Y"),
+]
+
+
+def extract_times_from_filenames(paths):
+    """Parse granule times from file names in one vectorised pass."""
+    names = [os.path.basename(p) for p in paths]
+
+    for pattern, fmt in _FILENAME_TIME_PATTERNS:
+        matches = [pattern.search(name) for name in names]
+        if not all(matches):
+            continue
+
+        try:
+            times = pd.to_datetime(
+                [m.group(1) for m in matches], format=fmt, cache=True
+            )
+        except ValueError:
+            continue
+
+        return dict(zip(names, times))
+
+    return None
+
+
 def extract_time_from_dataset(ds):
     """Extract time from dataset metadata."""
     if "time" in ds.coords:
@@ -115,45 +239,237 @@ def extract_time_from_dataset(ds):
         return pd.to_datetime(ds.attrs["RangeBeginningDate"])
 
     if "GranuleID" in ds.attrs:
-        match = re.search(r'_(\d{6})_', ds.attrs["GranuleID"])
+        match = _GRANULE_RE.search(ds.attrs["GranuleID"])
         if match:
-            return pd.to_datetime(match.group(1), format="%m%Y")
+            return parse_granule_month(match.group(1))
 
     raise ValueError("Could not determine time from dataset.")
 
 
-def stream_dataset(short_name, start, end, chunks={}):
+def download_granules(short_name, results):
+    """Download granules concurrently and return sorted local paths."""
+    cache_dir = CACHE_DIR / short_name
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _fetch(granule):
+        file_name = granule.data_links()[0].split("/")[-1]
+        local_file = cache_dir / file_name
+        if local_file.exists():
+            return str(local_file)
+
+        # Download beside the cache and move in only once complete, so an
+        # interrupted run never leaves a truncated file under the cache
+        partial = tempfile.TemporaryDirectory(dir=cache_dir, prefix=".partial-")
+        with partial as tmp:
+            downloaded = earthaccess.download([granule], local_path=tmp)
+            if not downloaded:
+                raise RuntimeError(f"Download failed for granule {file_name}.")
+            os.replace(downloaded[0], local_file)
+
+        return str(local_file)
+
+    # Granule downloads are network-bound, so fan them out over threads
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as pool:
+        local_files = pool.map(_fetch, results)
+    return sorted(local_files)
+
+
+def stream_dataset(short_name, start, end, variables=None, bbox=None,
+                   chunks={}):
     """Search, download, and concatenate dataset over time."""
     results = earthaccess.search_data(
         short_name=short_name,
         temporal=(start, end)
     )
 
-    local_files = earthaccess.download(results)
+    local_files = download_granules(short_name, results)
+
+    # Parse all times up front; fall back to per-file metadata otherwise
+    file_times = extract_times_from_filenames(local_files)
+
+    def _preprocess(ds):
+        if file_times is not None:
+            time_value = file_times[os.path.basename(ds.encoding["source"])]
+        else:
+            time_value = extract_time_from_dataset(ds)
+
+        if variables is not None:
+            missing = [v for v in variables if v not in ds.variables]
+            if missing:
+                raise ValueError(f"{', '.join(missing)} not found.")
+            ds = ds[variables]
+
+        # Subset each granule before concat so only the window is read
+        if bbox is not None:
+            ds = spatial_subset(ds, *bbox)
 
-    datasets = []
-    for f in sorted(local_files):
-        ds = xr.open_dataset(f, chunks=chunks)
-        time_value = extract_time_from_dataset(ds)
-        ds = ds.expand_dims({"time": [time_value]})
-        datasets.append(ds)
+        return ds.expand_dims({"time": [time_value]})
 
-    ds_combined = xr.concat(datasets, dim="time")
-    return ds_combined.sortby("time")
+    ds_combined = xr.open_mfdataset(
+        local_files,
+        combine="nested",
+        concat_dim="time",
+        parallel=True,
+        chunks=chunks,
+        preprocess=_preprocess
+    ).sortby("time")
+
+    # One full-extent chunk per monthly granule, so downstream masking,
+    # regridding and writes never need to rechunk
+    grain = {dim: -1 for dim in ds_combined.dims}
+    grain["time"] = 1
+    return ds_combined.chunk(grain)
 
 
 def load_subset_dataset(short_name, variable_name):
     """Full loading pipeline."""
-    ds = stream_dataset(short_name, TIME_START, TIME_END)
-    ds = spatial_subset(ds, LAT_MIN, LAT_MAX, LON_MIN, LON_MAX)
+    ds = stream_dataset(
+        short_name, TIME_START, TIME_END,
+        variables=[variable_name],
+        bbox=(LAT_MIN, LAT_MAX, LON_MIN, LON_MAX)
+    )
     ds = temporal_subset(ds, TIME_START, TIME_END)
 
-    if variable_name not in ds.variables:
-        raise ValueError(f"{variable_name} not found.")
-
     return ds[variable_name]
 
 
+# ============================================================
+# Masking Kernels
+# ============================================================
+
+# Serial kernels: dask already runs one block per thread, and a monthly
+# block is too small for numba's own thread pool to pay off
+
+@njit(cache=True)
+def _mask_fill_kernel(a, fill_value):
+    flat = a.ravel()
+    out = np.empty(flat.size, dtype=np.float32)
+    for i in range(flat.size):
+        v = flat[i]
+        out[i] = np.nan if v == fill_value else v
+    return out.reshape(a.shape)
+
+
+@njit(cache=True)
+def _scale_qc_fill_kernel(raw, qc, fill_value, scale, offset):
+    raw_flat = raw.ravel()
+    qc_flat = qc.ravel()
+    out = np.empty(raw_flat.size, dtype=np.float32)
+    for i in range(raw_flat.size):
+        v = raw_flat[i]
+        # Only the mandatory QA bits (0-1) decide pixel quality
+        if (qc_flat[i] & 0x3) != 0 or v == fill_value:
+            out[i] = np.nan
+        else:
+            out[i] = v * scale + offset
+    return out.reshape(raw.shape)
+
+
+def mask_fill_value(da, fill_value):
+    """Replace fill values with NaN in a single float32 pass per block."""
+    fill_value = np.nan if fill_value is None else float(fill_value)
+
+    return xr.apply_ufunc(
+        lambda a: _mask_fill_kernel(np.ascontiguousarray(a), fill_value),
+        da,
+        dask="parallelized",
+        output_dtypes=[np.float32],
+        keep_attrs=True
+    )
+
+
+def qc_to_uint8(qc):
+    """Contiguous uint8 QC block, with missing (NaN) flags marked bad."""
+    if np.issubdtype(qc.dtype, np.floating):
+        qc = np.where(np.isnan(qc), 0xFF, qc)
+    return np.ascontiguousarray(qc, dtype=np.uint8)
+
+
+def scale_and_mask(raw, qc, fill_value, scale, offset):
+    """Fused scale, QC mask, and fill mask in a single float32 pass."""
+    fill_value = np.nan if fill_value is None else float(fill_value)
+
+    return xr.apply_ufunc(
+        lambda a, q: _scale_qc_fill_kernel(
+            np.ascontiguousarray(a), qc_to_uint8(q),
+            fill_value, scale, offset
+        ),
+        raw,
+        qc,
+        dask="parallelized",
+        output_dtypes=[np.float32]
+    )
+
+
+# ============================================================
+# Regridding
+# ============================================================
+
+# Per-axis overlap weights, keyed on source and target coordinates
+_REGRID_WEIGHTS = {}
+
+
+def cell_bounds(centers, spherical=False):
+    """Lower and upper cell bounds of a 1-D grid from its centres."""
+    centers = np.asarray(centers, dtype=np.float64)
+    mid = (centers[1:] + centers[:-1]) / 2
+    edges = np.concatenate([
+        [2 * centers[0] - mid[0]], mid, [2 * centers[-1] - mid[-1]]
+    ])
+
+    # Latitude bands are equal-area in sin(lat), not in degrees
+    if spherical:
+        edges = np.sin(np.deg2rad(np.clip(edges, -90, 90)))
+
+    return np.minimum(edges[:-1], edges[1:]), np.maximum(edges[:-1], edges[1:])
+
+
+def precompute_overlap_weights(src, tgt, spherical=False):
+    """Overlap of every target cell with every source cell along one axis."""
+    key = (spherical, src.tobytes(), tgt.tobytes())
+
+    if key not in _REGRID_WEIGHTS:
+        src_lo, src_hi = cell_bounds(src, spherical)
+        tgt_lo, tgt_hi = cell_bounds(tgt, spherical)
+        overlap = (
+            np.minimum.outer(tgt_hi, src_hi)
+            - np.maximum.outer(tgt_lo, src_lo)
+        )
+        _REGRID_WEIGHTS[key] = np.clip(overlap, 0, None).astype(np.float32)
+
+    return _REGRID_WEIGHTS[key]
+
+
+def regrid_conservative(da, target_lat, target_lon):
+    """Area-weighted regrid onto the target grid, ignoring NaN cells."""
+    w_lat = xr.DataArray(
+        precompute_overlap_weights(
+            da["Latitude"].values, target_lat.values, spherical=True
+        ),
+        dims=("Latitude", "src_lat"),
+        coords={"Latitude": target_lat.values}
+    )
+    w_lon = xr.DataArray(
+        precompute_overlap_weights(
+            da["Longitude"].values, target_lon.values
+        ),
+        dims=("Longitude", "src_lon"),
+        coords={"Longitude": target_lon.values}
+    )
+
+    src = da.rename({"Latitude": "src_lat", "Longitude": "src_lon"})
+    src = src.drop_vars(["src_lat", "src_lon"])
+
+    total = xr.dot(src.fillna(0), w_lat, w_lon, dim=["src_lat", "src_lon"])
+    weight = xr.dot(
+        src.notnull().astype(np.float32), w_lat, w_lon,
+        dim=["src_lat", "src_lon"]
+    )
+
+    regridded = total / weight.where(weight > 0)
+    return regridded.transpose("time", "Latitude", "Longitude")
+
+
 # ============================================================
 # Dataset Loaders
 # ============================================================
@@ -165,33 +481,36 @@ def load_no2():
         "Tropospheric_NO2"
     )
 
-    fill_value = no2.attrs.get("_FillValue")
-    if fill_value is not None:
-        no2 = no2.where(no2 != fill_value)
-
-    return no2
+    return mask_fill_value(no2, no2.attrs.get("_FillValue"))
 
 
 def load_aod():
     """Load MODIS Aqua AOD."""
+    short_name = "AER_DBDT_M10KM_L3_MODIS_AQUA"
     results = earthaccess.search_data(
-        short_name="AER_DBDT_M10KM_L3_MODIS_AQUA",
+        short_name=short_name,
         temporal=(TIME_START, TIME_END)
     )
 
-    local_files = earthaccess.download(results)
+    local_files = download_granules(short_name, results)
 
-    datasets = []
-    for f in sorted(local_files):
-        ds = xr.open_dataset(f)
+    def _preprocess(ds):
         ds = ds.sel(
             Latitude=slice(LAT_MIN, LAT_MAX),
             Longitude=slice(LON_MIN, LON_MAX)
         )
-        ds = ds[["COMBINE_AOD_550_AVG"]]
-        datasets.append(ds)
-
-    ds_combined = xr.concat(datasets, dim="Time").sortby("Time")
+        return ds[["COMBINE_AOD_550_AVG"]]
+
+    # Reads still take xarray's HDF5 lock, so opens only overlap across
+    # the separate dask worker processes
+    ds_combined = xr.open_mfdataset(
+        local_files,
+        engine="h5netcdf",
+        combine="nested",
+        concat_dim="Time",
+        parallel=True,
+        preprocess=_preprocess
+    ).sortby("Time")
     aod = ds_combined["COMBINE_AOD_550_AVG"]
 
     return aod.rename({"Time": "time"}).transpose(
@@ -201,19 +520,51 @@ def load_aod():
 
 def load_lst():
     """Load MODIS Land Surface Temperature."""
-    ds = stream_dataset("MOD11C3", TIME_START, TIME_END)
-    ds = spatial_subset(ds, LAT_MIN, LAT_MAX, LON_MIN, LON_MAX)
+    ds = stream_dataset(
+        "MOD11C3", TIME_START, TIME_END,
+        variables=["LST_Day_CMG", "QC_Day"],
+        bbox=(LAT_MIN, LAT_MAX, LON_MIN, LON_MAX)
+    )
+
+    raw = ds["LST_Day_CMG"]
 
-    lst = ds["LST_Day_CMG"] * 0.02 - 273.15
-    qc = ds["QC_Day"]
+    return scale_and_mask(
+        raw,
+        ds["QC_Day"],
+        raw.attrs.get("_FillValue"),
+        scale=0.02,
+        offset=-273.15
+    )
+
+
+def load_cached(name, loader):
+    """Load a variable from its zarr store, building it on first run."""
+    # Key the store on the processing version and study window so that
+    # changing either never reuses stale data
+    store = (
+        f"{name}_v{STORE_VERSION}_{TIME_START}_{TIME_END}"
+        f"_{LAT_MIN}_{LAT_MAX}_{LON_MIN}_{LON_MAX}.zarr"
+    )
 
-    lst = lst.where(qc == 0)
+    if not os.path.exists(store):
+        da = loader()
+        ds = da.to_dataset(name=name)
 
-    fill_value = lst.attrs.get("_FillValue")
-    if fill_value is not None:
-        lst = lst.where(lst != fill_value)
+        # Source netCDF chunk encodings would clash with the new chunks
+        for var in ds.variables.values():
+            var.encoding.clear()
 
-    return lst
+        # One year of full-extent grids per chunk
+        chunks = {dim: -1 for dim in da.dims}
+        chunks["time"] = 12
+
+        # Write aside and move into place only once complete, so a run
+        # that dies mid-write never leaves a store without metadata
+        partial = f"{store}.partial"
+        ds.chunk(chunks).to_zarr(partial, mode="w", consolidated=True)
+        os.replace(partial, store)
+
+    return xr.open_zarr(store, consolidated=True)[name]
 
 
 # ============================================================
@@ -229,7 +580,10 @@ with open(os.path.expanduser("~/.cdsapirc"), "w") as f:
 
 c = cdsapi.Client()
 
-c.retrieve(
+# CDS queues requests for minutes to hours, so retrieve in the background
+# while the Earthdata and Earth Engine datasets load
+era_request = run_in_background(
+    c.retrieve,
     "reanalysis-era5-land-monthly-means",
     {
         "format": "netcdf",
@@ -243,74 +597,181 @@ c.retrieve(
     "ERA5_PH.nc"
 )
 
-era = xr.open_dataset("ERA5_PH.nc")
+# Rejected requests (bad key, invalid parameters) fail within seconds
+wait([era_request], timeout=CDS_REJECT_TIMEOUT)
+raise_if_failed(era_request)
 
-era = era.rename({
-    "valid_time": "time",
-    "latitude": "Latitude",
-    "longitude": "Longitude"
-})
 
-era["skt"] = era["skt"] - 273.15
-era = era.sortby("Latitude")
-era = era.transpose("time", "Latitude", "Longitude")
+def load_era5():
+    """Load the retrieved ERA5-Land skin temperature in °C."""
+    era = xr.open_dataset("ERA5_PH.nc", chunks={})
+
+    era = era.rename({
+        "valid_time": "time",
+        "latitude": "Latitude",
+        "longitude": "Longitude"
+    })
+
+    # Kept lazy so dask fuses the cast and offset into the final write
+    era["skt"] = era["skt"].astype("float32") - np.float32(273.15)
+    era = era.sortby("Latitude")
+    return era.transpose("time", "Latitude", "Longitude")
+
 
 # ============================================================
 # Nighttime Lights (Google Earth Engine)
 # ============================================================
 
-philippines = ee.Geometry.Rectangle([116, 4, 127, 21])
-
 ntl_collection = (
     ee.ImageCollection("NOAA/VIIRS/DNB/MONTHLY_V1/VCMSLCFG")
     .filterDate(TIME_START, "2025-01-01")
     .select("avg_rad")
 )
 
+# Pixel centres on the common grid, north-west corner first
+NTL_TRANSFORM = [
+    GRID_RES, 0, LON_MIN - GRID_RES / 2,
+    0, -GRID_RES, LAT_MAX + GRID_RES / 2
+]
+
 def resample_to_01deg(image):
     return (
         image
         .reduceResolution(ee.Reducer.mean(), maxPixels=1024)
-        .reproject(crs="EPSG:4326", scale=10000)
-        .clip(philippines)
+        .reproject(crs="EPSG:4326", crsTransform=NTL_TRANSFORM)
         .set("system:time_start", image.get("system:time_start"))
     )
 
-ntl_stack = ntl_collection.map(resample_to_01deg).toBands()
-
-task = ee.batch.Export.image.toDrive(
-    image=ntl_stack,
-    description="NTL_PH_2019_2024",
-    folder="EarthEngineExports",
-    fileNamePrefix="NTL_PH_2019_2024",
-    region=philippines,
-    scale=10000,
-    crs="EPSG:4326",
-    maxPixels=1e13
-)
 
-task.start()
+def ntl_tile_requests(expression, n_rows, n_cols):
+    """Build computePixels requests tiling the grid into 1° blocks."""
+    requests = []
+    for row in range(0, n_rows, NTL_TILE_SIZE):
+        for col in range(0, n_cols, NTL_TILE_SIZE):
+            height = min(NTL_TILE_SIZE, n_rows - row)
+            width = min(NTL_TILE_SIZE, n_cols - col)
+            requests.append((row, col, {
+                "expression": expression,
+                "fileFormat": "NUMPY_NDARRAY",
+                "grid": {
+                    "dimensions": {"width": width, "height": height},
+                    "affineTransform": {
+                        "scaleX": GRID_RES,
+                        "shearX": 0,
+                        "translateX": NTL_TRANSFORM[2] + col * GRID_RES,
+                        "shearY": 0,
+                        "scaleY": -GRID_RES,
+                        "translateY": NTL_TRANSFORM[5] - row * GRID_RES,
+                    },
+                    "crsCode": "EPSG:4326",
+                },
+            }))
+    return requests
+
+
+def load_ntl():
+    """Fetch VIIRS nighttime lights directly onto the common grid."""
+    lat = np.round(np.arange(LAT_MIN, LAT_MAX + GRID_RES / 2, GRID_RES), 1)
+    lon = np.round(np.arange(LON_MIN, LON_MAX + GRID_RES / 2, GRID_RES), 1)
+
+    times = pd.to_datetime(
+        ntl_collection.aggregate_array("system:time_start").getInfo(),
+        unit="ms"
+    )
+    ntl_stack = ntl_collection.map(resample_to_01deg).toBands()
+
+    requests = ntl_tile_requests(ntl_stack, len(lat), len(lon))
+
+    values = np.full((len(times), len(lat), len(lon)), np.nan, np.float32)
+
+    # Tile fetches are network-bound, so fan them out over threads and
+    # write each tile into place as soon as it arrives; popping the
+    # finished future releases its tile once it has been copied
+    with ThreadPoolExecutor(max_workers=MAX_EE_WORKERS) as pool:
+        futures = {
+            pool.submit(ee.data.computePixels, request): (row, col)
+            for row, col, request in requests
+        }
+        for future in as_completed(futures):
+            row, col = futures.pop(future)
+            tile = future.result()
+            block = np.stack([tile[band] for band in tile.dtype.names])
+            _, height, width = block.shape
+            values[:, row:row + height, col:col + width] = block
+
+    # Rows were fetched north to south; flip to ascending latitude
+    return xr.DataArray(
+        values[:, ::-1, :],
+        dims=("time", "Latitude", "Longitude"),
+        coords={"time": times, "Latitude": lat, "Longitude": lon},
+        name="NTL"
+    )
+
 
 # ============================================================
 # Load All Datasets
 # ============================================================
 
-no2 = load_no2()
-aod = load_aod()
-lst = load_lst()
+# float32 is ample for these retrievals and halves memory traffic
+no2 = load_cached("NO2", load_no2).astype("float32")
+raise_if_failed(era_request)
+aod = load_cached("AOD", load_aod).astype("float32")
+raise_if_failed(era_request)
+ntl = load_ntl()
+
+# Wait for the background CDS retrieval started above
+era_request.result()
+era = load_era5()
 
-# Interpolate to ERA5 grid
+# Conservatively regrid to ERA5 grid (weights computed once per grid)
 target_lat = era["Latitude"]
 target_lon = era["Longitude"]
 
-no2_interp = no2.interp(Latitude=target_lat, Longitude=target_lon)
-aod_interp = aod.interp(Latitude=target_lat, Longitude=target_lon)
-
-# Final merged dataset
-final_ds = xr.Dataset({
-    "NO2": no2_interp,
-    "AOD": aod_interp,
-    "LST": era["skt"]
-}).compute()
+no2_interp = regrid_conservative(no2, target_lat, target_lon)
+aod_interp = regrid_conservative(aod, target_lat, target_lon)
+
+# Final merged dataset (kept lazy; written chunk by chunk). Every layer is
+# on the ERA5 grid; snapping each to ERA5's months (gaps padded, extra
+# months dropped) lets the raw arrays share one coordinate set, so the
+# Dataset is built without an alignment pass.
+dims = ("time", "Latitude", "Longitude")
+coords = {
+    "time": era["time"].values,
+    "Latitude": target_lat.values,
+    "Longitude": target_lon.values
+}
+layers = {
+    "NO2": align_to_months(no2_interp, coords["time"], "NO2"),
+    "AOD": align_to_months(aod_interp, coords["time"], "AOD"),
+    "LST": era["skt"],
+    "NTL": align_to_months(ntl, coords["time"], "NTL")
+}
+
+final_ds = xr.Dataset(
+    {name: (dims, layer.data) for name, layer in layers.items()},
+    coords=coords
+)
 
-final_ds.to_netcdf("MASTER_PH_Pollution_2019_2024.nc")
+# One-year, full-extent HDF5 chunks; dask chunks match so every write
+# fills whole compressed chunks
+n_time = min(12, final_ds.sizes["time"])
+n_lat, n_lon = final_ds.sizes["Latitude"], final_ds.sizes["Longitude"]
+final_ds = final_ds.chunk({"time": n_time, "Latitude": -1, "Longitude": -1})
+
+encoding = {
+    var: {
+        "dtype": "float32",
+        "zlib": True,
+        "complevel": 4,
+        "shuffle": True,
+        "chunksizes": (n_time, n_lat, n_lon)
+    }
+    for var in final_ds.data_vars
+}
+
+final_ds.to_netcdf(
+    "MASTER_PH_Pollution_2019_2024.nc",
+    engine="h5netcdf",
+    compute=True,
+    encoding=encoding
+)